@@ -12,21 +12,23 @@ Rotas:
 """
 
 from typing import List
-from fastapi import APIRouter, status, Depends, HTTPException
+from fastapi import APIRouter, status, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 from models.artigo_model import ArtigoModel
-from models.usuario_model import UsuarioModel
 from schemas.artigo_schema import ArtigoSchema, ArtigoSchemaUp
-from core.deps import get_session, get_current_user
+from core.cache import construir_chave_cache
+from core.deps import get_session, get_current_user, UsuarioAtual
 
 router = APIRouter()
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=ArtigoSchema)
 async def post_artigo(artigo: ArtigoSchema,
-                      usuario_logado: UsuarioModel = Depends(get_current_user),
+                      usuario_logado: UsuarioAtual = Depends(get_current_user),
                       db: AsyncSession = Depends(get_session)) -> ArtigoSchema:
     """
     Cria um novo artigo.
@@ -39,25 +41,47 @@ async def post_artigo(artigo: ArtigoSchema,
     """
     novo_artigo = ArtigoModel(titulo=artigo.titulo,
                               descricao=artigo.descricao,
-                              url_fonte=str(artigo.url_fonte),
+                              url_fonte=artigo.url_fonte,
                               usuario_id=usuario_logado.id)
     db.add(novo_artigo)
+    # O flush emite o INSERT e já traz o id gerado, evitando um SELECT
+    # extra na serialização da resposta.
+    await db.flush()
     await db.commit()
+    await FastAPICache.clear(namespace="artigos")
     return novo_artigo
 
 
-@router.get("/", response_model=List[ArtigoSchema])
-async def get_artigos(db: AsyncSession = Depends(get_session)) -> List[ArtigoSchema]:
+@router.get("/")
+@cache(expire=30, namespace="artigos", key_builder=construir_chave_cache)
+async def get_artigos(skip: int = Query(0, ge=0),
+                      limit: int = Query(50, ge=1, le=200),
+                      db: AsyncSession = Depends(get_session)) -> List[dict]:
     """
-    Retorna uma lista de artigos.
+    Retorna uma lista paginada de artigos.
 
+    Os dados vêm direto do banco como dicionários e são codificados pelo
+    orjson, sem passar pela validação de um response_model — o caminho
+    quente desta rota é a serialização, não a consulta.
+
+    A resposta é cacheada no Redis por 30 segundos; as rotas de escrita
+    invalidam o namespace "artigos" a cada mutação.
+
+    :param skip: Quantidade de artigos a pular a partir do início.
+    :param limit: Quantidade máxima de artigos retornados (até 200).
     :param db: Sessão do banco de dados.
 
-    :return: Lista de artigos.
+    :return: Lista de artigos da página solicitada.
     """
-    query = select(ArtigoModel)
+    query = select(
+        ArtigoModel.id,
+        ArtigoModel.titulo,
+        ArtigoModel.descricao,
+        ArtigoModel.url_fonte,
+        ArtigoModel.usuario_id
+    ).order_by(ArtigoModel.id).offset(skip).limit(limit)
     result = await db.execute(query)
-    artigos = list(result.scalars().unique().all())
+    artigos = [dict(linha) for linha in result.mappings().all()]
     return artigos
 
 
@@ -74,9 +98,7 @@ async def get_artigo(artigo_id: int,
 
     :raises HTTPException: Se o artigo não for encontrado (HTTP 404).
     """
-    query = select(ArtigoModel).filter(ArtigoModel.id == artigo_id)
-    result = await db.execute(query)
-    artigo = result.scalars().unique().one_or_none()
+    artigo = await db.get(ArtigoModel, artigo_id)
 
     if artigo:
         return artigo
@@ -91,7 +113,7 @@ async def get_artigo(artigo_id: int,
 async def put_artigo(artigo_id: int,
                      artigo_atualizado: ArtigoSchemaUp,
                      db: AsyncSession = Depends(get_session),
-                     usuario_logado: UsuarioModel = Depends(get_current_user)) -> ArtigoSchema:
+                     usuario_logado: UsuarioAtual = Depends(get_current_user)) -> ArtigoSchema:
     """
     Atualiza um artigo existente pelo ID.
 
@@ -104,9 +126,7 @@ async def put_artigo(artigo_id: int,
 
     :raises HTTPException: Se o usuário não for o criador do artigo (HTTP 401) ou se o artigo não existir (HTTP 404).
     """
-    query = select(ArtigoModel).filter(ArtigoModel.id == artigo_id)
-    result = await db.execute(query)
-    artigo = result.scalars().unique().one_or_none()
+    artigo = await db.get(ArtigoModel, artigo_id)
 
     if artigo:
         if usuario_logado.id != artigo.usuario_id:
@@ -119,9 +139,10 @@ async def put_artigo(artigo_id: int,
         if artigo_atualizado.descricao:
             artigo.descricao = artigo_atualizado.descricao
         if artigo_atualizado.url_fonte:
-            artigo.url_fonte = str(artigo_atualizado.url_fonte)
+            artigo.url_fonte = artigo_atualizado.url_fonte
 
         await db.commit()
+        await FastAPICache.clear(namespace="artigos")
         return artigo
     else:
         raise HTTPException(
@@ -133,7 +154,7 @@ async def put_artigo(artigo_id: int,
 @router.delete("/{artigo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_artigo(artigo_id: int,
                         db: AsyncSession = Depends(get_session),
-                        usuario_logado: UsuarioModel = Depends(get_current_user)) -> JSONResponse:
+                        usuario_logado: UsuarioAtual = Depends(get_current_user)) -> JSONResponse:
     """
     Remove um artigo pelo ID.
 
@@ -145,9 +166,7 @@ async def delete_artigo(artigo_id: int,
 
     :raises HTTPException: Se o usuário não for o criador do artigo (HTTP 401) ou se o artigo não existir (HTTP 404).
     """
-    query = select(ArtigoModel).filter(ArtigoModel.id == artigo_id)
-    result = await db.execute(query)
-    artigo = result.scalars().unique().one_or_none()
+    artigo = await db.get(ArtigoModel, artigo_id)
 
     if artigo:
         if artigo.usuario_id != usuario_logado.id:
@@ -157,6 +176,7 @@ async def delete_artigo(artigo_id: int,
             )
         await db.delete(artigo)
         await db.commit()
+        await FastAPICache.clear(namespace="artigos")
         return JSONResponse(
             content={"message": "Exclusão feita com sucesso."},
             status_code=status.HTTP_200_OK
@@ -6,6 +6,7 @@ Rotas:
 
 - GET /logado: Retorna o usuário autenticado.
 - POST /signup: Cria um novo usuário.
+- POST /bulk: Cadastra vários usuários de uma vez via COPY.
 - GET /: Retorna uma lista de usuários.
 - GET /{usuario_id}: Retorna um usuário específico pelo ID.
 - PUT /{usuario_id}: Atualiza um usuário existente pelo ID.
@@ -13,24 +14,42 @@ Rotas:
 - POST /login: Autentica um usuário e retorna um token de acesso.
 """
 
+import asyncio
 from typing import List
-from fastapi import APIRouter, status, Depends, HTTPException
+from asyncpg.exceptions import UniqueViolationError
+from fastapi import APIRouter, status, Depends, HTTPException, Query
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 from models.usuario_model import UsuarioModel
-from schemas.usuario_schema import UsuarioSchemaBase, UsuarioSchemaCreate, UsuarioSchemaUp, UsuarioSchemaArtigos
-from core.deps import get_session, get_current_user
+from schemas.usuario_schema import (
+    UsuarioSchemaBase,
+    UsuarioSchemaCreate,
+    UsuarioSchemaUp,
+    UsuarioListAdapter,
+    fast_from_row,
+    rebuild_usuario_artigos_schema
+)
+from schemas.usuario_struct import encode_usuario_artigos
+from core.cache import construir_chave_cache
+from core.deps import get_session, get_current_user, invalidar_cache_token, UsuarioAtual
 from core.security import gerar_hash_senha
 from core.auth import autenticar, criar_token_acesso
 
+# Este roteador retorna usuários com artigos: resolve aqui, uma única vez,
+# a referência adiada de "UsuarioSchemaArtigos" a "ArtigoSchema".
+rebuild_usuario_artigos_schema()
+
 router = APIRouter()
 
 
 @router.get("/logado", response_model=UsuarioSchemaBase)
-def get_logado(usuario_logado: UsuarioModel = Depends(get_current_user)) -> UsuarioSchemaBase:
+def get_logado(usuario_logado: UsuarioAtual = Depends(get_current_user)) -> UsuarioSchemaBase:
     """
     Retorna o usuário autenticado.
 
@@ -53,16 +72,30 @@ async def post_usuario(usuario: UsuarioSchemaCreate, db: AsyncSession = Depends(
 
     :raises HTTPException: Se já existir um usuário com o e-mail fornecido (HTTP 406).
     """
+    # Verifica a unicidade do e-mail antes de gerar o hash da senha, para não
+    # gastar o custo do bcrypt em tentativas de cadastro duplicado.
+    exists_q = select(UsuarioModel.id).where(UsuarioModel.email == usuario.email).limit(1)
+    result = await db.execute(exists_q)
+    if result.scalar_one_or_none() is not None:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail="Já existe um usuário com esse e-mail cadastrado."
+        )
+
     novo_usuario = UsuarioModel(
         nome=usuario.nome,
         sobrenome=usuario.sobrenome,
         email=usuario.email,
-        senha=gerar_hash_senha(usuario.senha),
+        senha=await gerar_hash_senha(usuario.senha.get_secret_value()),
         admin=usuario.admin
     )
     try:
         db.add(novo_usuario)
+        # O flush emite o INSERT e já traz o id gerado, evitando um SELECT
+        # extra na serialização da resposta.
+        await db.flush()
         await db.commit()
+        await FastAPICache.clear(namespace="usuarios")
         return novo_usuario
     except IntegrityError:
         raise HTTPException(
@@ -71,26 +104,92 @@ async def post_usuario(usuario: UsuarioSchemaCreate, db: AsyncSession = Depends(
         )
 
 
-@router.get("/", response_model=List[UsuarioSchemaBase])
-async def get_usuario(db: AsyncSession = Depends(get_session)) -> List[UsuarioSchemaBase]:
+@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+async def post_usuarios_bulk(usuarios: List[UsuarioSchemaCreate],
+                             db: AsyncSession = Depends(get_session)) -> JSONResponse:
+    """
+    Cadastra vários usuários de uma vez.
+
+    Os hashes das senhas são gerados em paralelo no pool de processos e os
+    registros são enviados em um único lote pelo protocolo COPY do
+    PostgreSQL, que é ordens de magnitude mais rápido do que um INSERT por
+    linha para cargas como importações de CSV ou migrações.
+
+    :param usuarios: Lista de usuários a cadastrar.
+    :param db: Sessão do banco de dados.
+
+    :return: Mensagem com a quantidade de usuários cadastrados.
+
+    :raises HTTPException: Se algum e-mail do lote já estiver cadastrado (HTTP 406).
+    """
+    hashes = await asyncio.gather(
+        *(gerar_hash_senha(u.senha.get_secret_value()) for u in usuarios)
+    )
+    registros = [
+        (u.nome, u.sobrenome, u.email, hash_senha, u.admin)
+        for u, hash_senha in zip(usuarios, hashes)
+    ]
+
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    try:
+        await raw.driver_connection.copy_records_to_table(
+            'usuarios',
+            records=registros,
+            columns=['nome', 'sobrenome', 'email', 'senha', 'admin']
+        )
+    except UniqueViolationError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail="Já existe um usuário com esse e-mail cadastrado."
+        )
+
+    await db.commit()
+    await FastAPICache.clear(namespace="usuarios")
+    return JSONResponse(
+        content={"message": f"{len(registros)} usuários cadastrados com sucesso."},
+        status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.get("/")
+@cache(expire=30, namespace="usuarios", key_builder=construir_chave_cache)
+async def get_usuario(skip: int = Query(0, ge=0),
+                      limit: int = Query(50, ge=1, le=200),
+                      db: AsyncSession = Depends(get_session)) -> List[dict]:
     """
-    Retorna uma lista de usuários.
+    Retorna uma lista paginada de usuários (shape de "UsuarioSchemaBase").
+
+    A resposta é cacheada no Redis por 30 segundos; as rotas de escrita
+    invalidam o namespace "usuarios" a cada mutação.
 
+    :param skip: Quantidade de usuários a pular a partir do início.
+    :param limit: Quantidade máxima de usuários retornados (até 200).
     :param db: Sessão do banco de dados.
 
-    :return: Lista de usuários.
+    :return: Lista de usuários da página solicitada.
     """
-    async with db:
-        query = select(UsuarioModel)
-        result = await db.execute(query)
-        usuarios = list(result.scalars().unique().all())
-        return usuarios
+    query = select(UsuarioModel).order_by(UsuarioModel.id).offset(skip).limit(limit)
+    result = await db.execute(query)
+    usuarios = result.scalars().all()
+    # Linhas do banco são confiáveis: monta os schemas sem validação e
+    # serializa a lista inteira em uma única travessia do pydantic-core,
+    # em vez de reentrar no serializador uma vez por linha.
+    return UsuarioListAdapter.dump_python(
+        [fast_from_row(usuario) for usuario in usuarios],
+        mode='json'
+    )
 
 
-@router.get("/{usuario_id}", response_model=UsuarioSchemaArtigos, status_code=status.HTTP_200_OK)
-async def get_usuario(usuario_id: int, db: AsyncSession = Depends(get_session)) -> UsuarioSchemaArtigos:
+@router.get("/{usuario_id}", status_code=status.HTTP_200_OK)
+async def get_usuario(usuario_id: int, db: AsyncSession = Depends(get_session)) -> Response:
     """
-    Retorna um usuário específico pelo ID.
+    Retorna um usuário específico pelo ID, com seus artigos.
+
+    A resposta é montada com os espelhos msgspec de "UsuarioSchemaArtigos" e
+    codificada direto em JSON, sem passar pelo serializador do Pydantic —
+    dados vindos do banco são confiáveis e dispensam revalidação.
 
     :param usuario_id: ID do usuário a ser recuperado.
     :param db: Sessão do banco de dados.
@@ -99,12 +198,14 @@ async def get_usuario(usuario_id: int, db: AsyncSession = Depends(get_session))
 
     :raises HTTPException: Se o usuário não for encontrado (HTTP 404).
     """
-    query = select(UsuarioModel).filter(UsuarioModel.id == usuario_id)
-    result = await db.execute(query)
-    usuario = result.scalars().unique().one_or_none()
+    usuario = await db.get(
+        UsuarioModel,
+        usuario_id,
+        options=[selectinload(UsuarioModel.artigos)]
+    )
 
     if usuario:
-        return usuario
+        return Response(content=encode_usuario_artigos(usuario), media_type="application/json")
     else:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -127,9 +228,7 @@ async def put_usuario(usuario_id: int,
 
     :raises HTTPException: Se o usuário não existir (HTTP 404).
     """
-    query = select(UsuarioModel).filter(UsuarioModel.id == usuario_id)
-    result = await db.execute(query)
-    usuario = result.scalars().unique().one_or_none()
+    usuario = await db.get(UsuarioModel, usuario_id)
 
     if usuario:
         if usuario_atualizado.nome is not None:
@@ -141,9 +240,11 @@ async def put_usuario(usuario_id: int,
         if usuario_atualizado.admin is not None:
             usuario.admin = usuario_atualizado.admin
         if usuario_atualizado.senha is not None:
-            usuario.senha = gerar_hash_senha(usuario_atualizado.senha)
+            usuario.senha = await gerar_hash_senha(usuario_atualizado.senha.get_secret_value())
 
         await db.commit()
+        invalidar_cache_token(usuario_id)
+        await FastAPICache.clear(namespace="usuarios")
         return usuario
     else:
         raise HTTPException(
@@ -164,13 +265,20 @@ async def delete_usuario(usuario_id: int, db: AsyncSession = Depends(get_session
 
     :raises HTTPException: Se o usuário não existir (HTTP 404).
     """
-    query = select(UsuarioModel).filter(UsuarioModel.id == usuario_id)
-    result = await db.execute(query)
-    usuario = result.scalars().unique().one_or_none()
+    # Carrega os artigos junto, pois o cascade "delete-orphan" precisa deles.
+    usuario = await db.get(
+        UsuarioModel,
+        usuario_id,
+        options=[selectinload(UsuarioModel.artigos)]
+    )
 
     if usuario:
         await db.delete(usuario)
         await db.commit()
+        invalidar_cache_token(usuario_id)
+        await FastAPICache.clear(namespace="usuarios")
+        # O cascade "delete-orphan" também removeu os artigos do usuário.
+        await FastAPICache.clear(namespace="artigos")
         return JSONResponse(
             content={"message": "Exclusão feita com sucesso."},
             status_code=status.HTTP_200_OK
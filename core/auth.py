@@ -8,25 +8,32 @@ Funções:
 - criar_token_acesso: Cria um token de acesso JWT para um usuário.
 """
 
+import time
 from typing import Optional
-from pytz import timezone
-from datetime import datetime, timedelta
+from datetime import timedelta
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import bindparam
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import jwt
+import jwt
 from models.usuario_model import UsuarioModel
 from .configs import settings
 from .security import verificar_senha
-from pydantic import EmailStr
 
 
 oauth2_schema = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/usuarios/login"
 )
 
+_LOGIN_STMT = select(UsuarioModel).where(UsuarioModel.email == bindparam('email'))
+"""
+Statement de busca de usuário por e-mail construído uma única vez no import.
+O login é caminho quente e reaproveitar o statement evita reconstruir e
+recompilar o select a cada chamada de "autenticar".
+"""
+
 
-async def autenticar(email: EmailStr, senha: str, db: AsyncSession) -> Optional[UsuarioModel]:
+async def autenticar(email: str, senha: str, db: AsyncSession) -> Optional[UsuarioModel]:
     """
     Verifica as credenciais de um usuário.
 
@@ -36,17 +43,15 @@ async def autenticar(email: EmailStr, senha: str, db: AsyncSession) -> Optional[
 
     :return: O usuário autenticado se as credenciais estiverem corretas, caso contrário, retorna None.
     """
-    async with db as session:
-        query = select(UsuarioModel).filter(UsuarioModel.email == email)
-        result = await session.execute(query)
-        usuario = result.scalars().unique().one_or_none()
+    result = await db.execute(_LOGIN_STMT, {'email': email})
+    usuario = result.scalar_one_or_none()
 
-        if not usuario:
-            return None
-        if not verificar_senha(senha, usuario.senha):
-            return None
+    if not usuario:
+        return None
+    if not await verificar_senha(senha, usuario.senha):
+        return None
 
-        return usuario
+    return usuario
 
 
 def _criar_token(tipo_token: str, tempo_vida: timedelta, sub: str) -> str:
@@ -59,14 +64,15 @@ def _criar_token(tipo_token: str, tempo_vida: timedelta, sub: str) -> str:
 
     :return: O token JWT codificado.
     """
-    sp = timezone('America/Sao_Paulo')
-    expira = datetime.now(tz=sp) + tempo_vida
+    # Os campos "exp" e "iat" são segundos UTC pela RFC 7519: inteiros de
+    # epoch dispensam qualquer alocação de datetime/timezone por token.
+    agora = int(time.time())
 
     # https://datatracker.ietf.org/doc/html/rfc7519#section-4.1.3 (parâmetros de payload)
     payload = {
         "type": tipo_token,
-        "exp": expira,
-        "iat": datetime.now(tz=sp),
+        "exp": agora + int(tempo_vida.total_seconds()),
+        "iat": agora,
         "sub": str(sub)
     }
 
@@ -0,0 +1,49 @@
+"""
+Módulo de apoio ao cache de respostas no Redis.
+Define o construtor de chaves usado pelos decoradores "@cache" das rotas.
+
+Funções:
+
+- construir_chave_cache: Gera a chave de cache a partir da rota e de seus parâmetros.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+from starlette.requests import Request
+from starlette.responses import Response
+
+_KWARGS_IGNORADOS = frozenset({'db'})
+"""
+Parâmetros injetados por dependência que não participam da chave: a repr de
+uma "AsyncSession" embute o endereço do objeto em memória, e uma chave que
+varia por sessão fragmentaria o cache em entradas de uso único.
+"""
+
+
+def construir_chave_cache(func: Callable[..., Any],
+                          namespace: str = "",
+                          *,
+                          request: Optional[Request] = None,
+                          response: Optional[Response] = None,
+                          args: Tuple[Any, ...] = (),
+                          kwargs: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Gera a chave de cache de uma rota a partir do nome e dos parâmetros.
+
+    Diferente do "default_key_builder" do fastapi-cache, ignora os kwargs
+    injetados por dependência (como a sessão do banco), de modo que duas
+    requisições com a mesma paginação compartilhem a mesma entrada no Redis.
+
+    :param func: Função da rota decorada.
+    :param namespace: Namespace do cache, já prefixado pelo decorador.
+    :param request: Requisição HTTP (não participa da chave).
+    :param response: Resposta HTTP (não participa da chave).
+    :param args: Argumentos posicionais da rota.
+    :param kwargs: Argumentos nomeados da rota.
+
+    :return: Chave de cache determinística para a rota e os parâmetros.
+    """
+    params = sorted(
+        (nome, valor) for nome, valor in (kwargs or {}).items()
+        if nome not in _KWARGS_IGNORADOS
+    )
+    return f"{namespace}:{func.__module__}.{func.__name__}:{params}"
@@ -51,6 +51,21 @@ class Settings(BaseModel):
     Tempo de expiração dos tokens de acesso em minutos (7 dias).
     """
 
+    BCRYPT_ROUNDS: int = 12
+    """
+    Fator de trabalho (rounds) usado na geração de hashes bcrypt.
+    """
+
+    SQL_ECHO: bool = False
+    """
+    Habilita o log de todas as instruções SQL emitidas pelo engine (apenas para depuração).
+    """
+
+    REDIS_URL: str = 'redis://localhost:6379/0'
+    """
+    URL de conexão com o Redis, usado como backend do cache de respostas.
+    """
+
     class Config:
         """
         Configurações adicionais para a classe Settings.
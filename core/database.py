@@ -13,11 +13,26 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine, async_sessionmaker
 from .configs import settings
 
-engine: AsyncEngine = create_async_engine(settings.DB_URL, future=True, echo=True)
+engine: AsyncEngine = create_async_engine(
+    settings.DB_URL,
+    future=True,
+    echo=settings.SQL_ECHO,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800
+)
 """
 Motor de banco de dados assíncrono criado usando a URL de conexão fornecida nas configurações.
 
 :param settings.DB_URL: URL de conexão com o banco de dados.
+:param echo: Loga o SQL emitido somente quando "SQL_ECHO" está habilitado nas configurações.
+:param pool_size: Número de conexões mantidas abertas no pool.
+:param max_overflow: Conexões extras permitidas além do pool em picos de carga.
+:param pool_timeout: Tempo máximo (em segundos) de espera por uma conexão livre.
+:param pool_pre_ping: Valida a conexão antes de usá-la, descartando conexões mortas.
+:param pool_recycle: Recicla conexões com mais de 30 minutos de vida.
 """
 
 base = declarative_base()
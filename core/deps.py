@@ -5,16 +5,21 @@ Fornece funções auxiliares para obter a sessão do banco de dados e o usuário
 Classes:
 
 - "TokenData": Modelo de dados para armazenar informações sobre o token JWT.
+- "UsuarioAtual": Projeção leve do usuário autenticado, sem o hash da senha.
 
 Funções:
 
 - "get_session": Fornece uma sessão assíncrona do banco de dados.
 - "get_current_user": Recupera o usuário autenticado com base no token JWT fornecido.
+- "invalidar_cache_token": Remove do cache de tokens as entradas de um usuário.
 """
 
-from typing import AsyncGenerator, Optional
+import time
+from collections import OrderedDict
+from typing import AsyncGenerator, Optional, Tuple
 from fastapi import Depends, HTTPException, status
-from jose import jwt, JWTError
+import jwt
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from pydantic import BaseModel
@@ -28,6 +33,60 @@ class TokenData(BaseModel):
     username: Optional[str] = None
 
 
+class UsuarioAtual(BaseModel):
+    """
+    Projeção leve do usuário autenticado, com apenas as colunas que as rotas
+    realmente consomem — o hash da senha e os artigos ficam de fora, o que
+    reduz os bytes trafegados do banco em toda requisição autenticada.
+    """
+    id: int
+    nome: Optional[str] = None
+    sobrenome: Optional[str] = None
+    email: str
+    admin: bool = False
+
+
+_USUARIO_STMT = select(
+    UsuarioModel.id,
+    UsuarioModel.nome,
+    UsuarioModel.sobrenome,
+    UsuarioModel.email,
+    UsuarioModel.admin
+).where(UsuarioModel.id == bindparam('id'))
+"""
+Statement de busca do usuário autenticado construído uma única vez no import,
+selecionando somente as colunas necessárias (sem o hash da senha).
+"""
+
+
+_TOKEN_CACHE: "OrderedDict[str, Tuple[UsuarioAtual, float]]" = OrderedDict()
+"""
+Cache LRU em memória que mapeia o token JWT para o usuário autenticado e o
+timestamp de expiração do token. Enquanto o token for válido, o resultado do
+"jwt.decode" e da consulta ao banco é determinístico, então requisições
+autenticadas subsequentes podem pular ambos.
+"""
+
+_TOKEN_CACHE_MAX: int = 4096
+"""
+Número máximo de tokens mantidos no cache antes do descarte LRU.
+"""
+
+
+def invalidar_cache_token(usuario_id: int) -> None:
+    """
+    Remove do cache de tokens todas as entradas pertencentes a um usuário.
+
+    Deve ser chamada quando o usuário é atualizado ou removido, para que
+    requisições seguintes voltem a consultar o banco de dados.
+
+    :param usuario_id: ID do usuário cujas entradas devem ser descartadas.
+    """
+    for token, (usuario, _) in list(_TOKEN_CACHE.items()):
+        if usuario.id == usuario_id:
+            _TOKEN_CACHE.pop(token, None)
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Fornece uma sessão assíncrona do banco de dados.
@@ -40,7 +99,7 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 
 async def get_current_user(
         db: AsyncSession = Depends(get_session),
-        token: str = Depends(oauth2_schema)) -> UsuarioModel:
+        token: str = Depends(oauth2_schema)) -> UsuarioAtual:
     """
     Recupera o usuário autenticado com base no token JWT fornecido.
 
@@ -51,6 +110,14 @@ async def get_current_user(
 
     :raises HTTPException: Se a autenticação falhar ou o usuário não for encontrado (HTTP 401).
     """
+    cacheado = _TOKEN_CACHE.get(token)
+    if cacheado is not None:
+        usuario_cacheado, exp = cacheado
+        if exp > time.time():
+            _TOKEN_CACHE.move_to_end(token)
+            return usuario_cacheado
+        _TOKEN_CACHE.pop(token, None)
+
     credential_exception: HTTPException = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Não foi possível autenticar a credencial",
@@ -70,14 +137,25 @@ async def get_current_user(
             raise credential_exception
 
         token_data = TokenData(username=username)
-    except JWTError:
+    except jwt.PyJWTError:
         raise credential_exception
 
-    query = select(UsuarioModel).filter(UsuarioModel.id == int(token_data.username))
-    result = await db.execute(query)
-    usuario: UsuarioModel = result.scalars().unique().one_or_none()
+    result = await db.execute(_USUARIO_STMT, {'id': int(token_data.username)})
+    linha = result.first()
 
-    if usuario is None:
+    if linha is None:
         raise credential_exception
 
+    usuario = UsuarioAtual(
+        id=linha.id,
+        nome=linha.nome,
+        sobrenome=linha.sobrenome,
+        email=linha.email,
+        admin=linha.admin
+    )
+
+    _TOKEN_CACHE[token] = (usuario, float(payload.get("exp", 0)))
+    if len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+        _TOKEN_CACHE.popitem(last=False)
+
     return usuario
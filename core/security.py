@@ -1,36 +1,91 @@
 """
 Módulo para operações relacionadas à segurança, incluindo verificação e geração de hashes de senha.
-Utiliza o `passlib` para gerenciar a criptografia de senhas.
+Utiliza o `bcrypt` diretamente, executando o cálculo em um executor de threads
+para não bloquear o event loop durante as requisições.
 
 Funções:
 
 - "verificar_senha": Verifica se uma senha fornecida corresponde ao hash armazenado.
 - "gerar_hash_senha": Gera um hash para uma senha fornecida.
+- "encerrar_pool_hash": Encerra o pool de processos usado na geração de hashes.
 """
 
-from passlib.context import CryptContext
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import bcrypt
+from .configs import settings
 
-CRIPTO = CryptContext(schemes=['bcrypt'], deprecated='auto')
+_HASH_POOL: Optional[ProcessPoolExecutor] = None
+"""
+Pool de processos usado na geração de hashes, criado sob demanda com um
+worker por núcleo de CPU. Rajadas de signup escalam entre os núcleos em
+vez de serializar o bcrypt em um único processo.
+"""
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    """
+    Retorna o pool de processos de hashing, criando-o na primeira chamada.
+
+    :return: O pool de processos dimensionado para os núcleos disponíveis.
+    """
+    global _HASH_POOL
+    if _HASH_POOL is None:
+        _HASH_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _HASH_POOL
 
 
-def verificar_senha(senha: str, hash_senha: str) -> bool:
+def encerrar_pool_hash() -> None:
+    """
+    Encerra o pool de processos de hashing, se ele tiver sido criado.
+
+    Deve ser chamada no desligamento da aplicação.
+    """
+    global _HASH_POOL
+    if _HASH_POOL is not None:
+        _HASH_POOL.shutdown(wait=False)
+        _HASH_POOL = None
+
+
+async def verificar_senha(senha: str, hash_senha: str) -> bool:
     """
     Verifica se a senha fornecida corresponde ao hash armazenado.
 
+    A comparação é despachada para um executor de threads, pois o bcrypt é
+    limitado por CPU e bloquearia o event loop durante o "POST /login".
+
     :param senha: Senha fornecida pelo usuário em texto puro.
     :param hash_senha: Hash da senha armazenado no banco de dados.
 
     :return: Retorna "True" se a senha corresponder ao hash fornecido e "False" caso contrário.
     """
-    return CRIPTO.verify(senha, hash_senha)
+    return await asyncio.to_thread(
+        bcrypt.checkpw,
+        senha.encode('utf-8'),
+        hash_senha.encode('utf-8')
+    )
 
 
-def gerar_hash_senha(senha: str) -> str:
+async def gerar_hash_senha(senha: str) -> str:
     """
     Gera um hash para a senha fornecida.
 
+    O fator de trabalho é controlado pela configuração "BCRYPT_ROUNDS" e o
+    cálculo é despachado para um pool de processos, de modo que hashes
+    concorrentes (rajadas de signup) escalem entre os núcleos de CPU em vez
+    de disputar o GIL.
+
     :param senha: Senha fornecida pelo usuário.
 
     :return: Retorna o hash gerado para a senha.
     """
-    return CRIPTO.hash(senha)
+    loop = asyncio.get_running_loop()
+    hash_senha = await loop.run_in_executor(
+        _get_hash_pool(),
+        bcrypt.hashpw,
+        senha.encode('utf-8'),
+        bcrypt.gensalt(settings.BCRYPT_ROUNDS)
+    )
+    return hash_senha.decode('utf-8')
@@ -1,8 +1,53 @@
+from contextlib import asynccontextmanager
+import jwt
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
+from sqlalchemy import text
 from core.configs import settings
+from core.database import async_session_local
+from core.security import encerrar_pool_hash, gerar_hash_senha
 from api.v1.api import api_router
 
-app = FastAPI(title='API - Gerenciamento de Artigos')
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Gerencia o ciclo de vida da aplicação.
+
+    Na inicialização, conecta ao Redis, inicializa o cache de respostas e
+    pré-aquece os custos de primeira requisição: o backend do bcrypt, o
+    registro de algoritmos do JWT e a primeira conexão do pool do banco.
+    No encerramento, libera o pool de hashing e fecha a conexão com o Redis.
+
+    :param app: A aplicação FastAPI.
+    """
+    redis = aioredis.from_url(settings.REDIS_URL, encoding="utf-8")
+    FastAPICache.init(RedisBackend(redis), prefix="art-api")
+
+    # Aquece o pool de hashing e o backend do bcrypt.
+    await gerar_hash_senha('warmup')
+    # Aquece o registro de algoritmos do PyJWT.
+    jwt.encode({}, settings.JWT_SECRET, algorithm=settings.ALGORITHM)
+    # Abre a primeira conexão do pool (handshake TCP/TLS fora da requisição #1).
+    async with async_session_local() as session:
+        await session.execute(text('SELECT 1'))
+    # Gera o documento OpenAPI uma vez; o FastAPI guarda o resultado em
+    # "app.openapi_schema" e as próximas consultas viram um lookup.
+    app.openapi()
+
+    yield
+    encerrar_pool_hash()
+    await redis.aclose()
+
+
+app = FastAPI(
+    title='API - Gerenciamento de Artigos',
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 """
 Instancia a aplicação FastAPI com o título 'API - Gerenciamento de Artigos'.
 
@@ -10,6 +55,8 @@ Inclui o roteador de endpoints, definindo um prefixo de rota com base
 na configuração "API_V1_STR", para organizar as rotas da API.
 
 :param title: O título da aplicação.
+:param lifespan: Gerenciador do ciclo de vida (inicializa o cache Redis).
+:param default_response_class: Serializa as respostas JSON com orjson (codificação em C).
 :param include_router: Adiciona um roteador de rotas da API.
 """
 app.include_router(api_router, prefix=settings.API_V1_STR)
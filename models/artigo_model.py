@@ -31,4 +31,4 @@ class ArtigoModel(base):
     usuario_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
 
     # Relacionamento com "UsuarioModel"
-    criador = relationship("UsuarioModel", back_populates="artigos", lazy="joined")
+    criador = relationship("UsuarioModel", back_populates="artigos", lazy="select")
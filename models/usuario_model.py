@@ -33,10 +33,12 @@ class UsuarioModel(base):
     admin = Column(Boolean, default=False)
 
     # Relacionamento com "ArtigoModel"
+    # "lazy='raise'" impede joins implícitos: rotas que precisam dos artigos
+    # devem carregá-los explicitamente com "selectinload".
     artigos = relationship(
         "ArtigoModel",
         cascade="all, delete-orphan",
         back_populates="criador",
         uselist=True,
-        lazy="joined"
+        lazy="raise"
     )
@@ -1,5 +1,15 @@
 from typing import Optional
-from pydantic import BaseModel, HttpUrl
+from typing_extensions import Annotated
+from pydantic import BaseModel, ConfigDict, StringConstraints
+
+from .usuario_schema import IdEstrito
+
+UrlFonte = Annotated[str, StringConstraints(max_length=256, pattern=r'^https?://')]
+"""
+Tipo para a URL de fonte de um artigo. A checagem por prefixo http(s) e
+tamanho roda no core em C do Pydantic v2 e é bem mais barata do que o parse
+RFC 3986 completo do "HttpUrl", dispensável para este campo.
+"""
 
 
 class ArtigoSchema(BaseModel):
@@ -12,25 +22,17 @@ class ArtigoSchema(BaseModel):
     - "id" (int, opcional): Identificador único do artigo.
     - "titulo" (str): Título do artigo.
     - "descricao" (str): Descrição do artigo.
-    - "url_fonte" (HttpUrl): URL da fonte do artigo.
+    - "url_fonte" (str): URL da fonte do artigo (deve começar com http:// ou https://).
     - "usuario_id" (int, opcional): Identificador do usuário que criou o artigo.
     - "senha" (str): Hash da senha do usuário.
     """
-    id: Optional[int] = None
+    model_config = ConfigDict(from_attributes=True)
+
+    id: IdEstrito = None
     titulo: str
     descricao: str
-    url_fonte: HttpUrl
-    usuario_id: Optional[int] = None
-
-    class Config:
-        """
-        Configurações da classe "ArtigoSchema".
-
-        Atributos:
-
-        - "from_attributes" (bool): Habilita a criação de instâncias do schema a partir de objetos do SQLAlchemy.
-        """
-        from_attributes = True
+    url_fonte: UrlFonte
+    usuario_id: IdEstrito = None
 
 
 class ArtigoSchemaUp(ArtigoSchema):
@@ -43,8 +45,8 @@ class ArtigoSchemaUp(ArtigoSchema):
 
     - "titulo" (str, opcional): Título do artigo (opcional para atualizações).
     - "descricao" (str, opcional): Descrição do artigo (opcional para atualizações).
-    - "url_fonte" (HttpUrl, opcional): URL da fonte do artigo (opcional para atualizações).
+    - "url_fonte" (str, opcional): URL da fonte do artigo (opcional para atualizações).
     """
     titulo: Optional[str] = None
     descricao: Optional[str] = None
-    url_fonte: Optional[HttpUrl] = None
+    url_fonte: Optional[UrlFonte] = None
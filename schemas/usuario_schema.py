@@ -1,6 +1,32 @@
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr
-from .artigo_schema import ArtigoSchema
+import sys
+from functools import lru_cache
+from typing import Generic, Optional, List, TypeVar, TYPE_CHECKING
+from typing_extensions import Annotated
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, SecretStr, TypeAdapter, create_model
+
+if TYPE_CHECKING:
+    from .artigo_schema import ArtigoSchema
+
+_EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+"""
+Padrão de e-mail definido uma vez no módulo e compilado uma única vez pelo
+pydantic-core na construção do schema. Evita o custo do "email-validator"
+(parse completo, punycode) em todo request; o "EmailStr" com checagem
+RFC fica restrito ao "UsuarioSchemaCreate", onde a entrada é nova.
+"""
+
+Email = Annotated[str, Field(pattern=_EMAIL_RE)]
+"""
+Tipo de e-mail validado pelo padrão leve acima, compartilhado entre os
+schemas para reaproveitar o mesmo validador.
+"""
+
+IdEstrito = Annotated[Optional[int], Field(strict=True, ge=0)]
+"""
+Tipo para identificadores. Com "strict=True" o pydantic-core valida pelo
+caminho curto de int, sem tentar as coerções de str/float — ids vêm do
+banco ou do path da rota, onde já chegam como inteiros.
+"""
 
 
 class UsuarioSchemaBase(BaseModel):
@@ -14,25 +40,58 @@ class UsuarioSchemaBase(BaseModel):
     - "id" (int, opcional): Identificador único do usuário.
     - "nome" (str): Nome do usuário.
     - "sobrenome" (str): Sobrenome do usuário.
-    - "email" (EmailStr): Endereço de e-mail do usuário.
+    - "email" (str): Endereço de e-mail do usuário, validado por padrão leve.
     - "admin" (bool): Indica se o usuário possui privilégios administrativos.
     """
 
-    id: Optional[int] = None
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        extra='ignore',
+        populate_by_name=True,
+        revalidate_instances='never',
+        validate_assignment=False,
+        validate_default=False,
+        str_strip_whitespace=False
+    )
+    """
+    O core schema só é construído no primeiro uso ("defer_build") e instâncias
+    já validadas não são revalidadas ao serem reaproveitadas em respostas
+    aninhadas ("revalidate_instances='never'"). Atribuições posteriores não
+    revalidam ("validate_assignment=False") e o pydantic-core não insere
+    passos de strip/validação de default por campo — mutações feitas depois
+    da construção são responsabilidade de quem escreve. As subclasses herdam.
+    """
+
+    id: IdEstrito = None
     nome: str
     sobrenome: str
-    email: EmailStr
-    admin: bool = False
+    email: Email
+    admin: Annotated[bool, Field(strict=True)] = False
 
-    class Config:
+    @classmethod
+    def from_orm_fast(cls, usuario) -> "UsuarioSchemaBase":
         """
-        Configurações da classe "UsuarioSchemaBase".
+        Constrói o schema a partir de uma linha do banco sem revalidação.
+
+        O banco é a fonte de verdade no caminho de leitura, então o
+        "model_construct" pula o pydantic-core inteiro (inclusive o parse de
+        "EmailStr"). Para entrada não confiável (signup, atualização), use a
+        validação normal.
 
-        Atributos:
+        :param usuario: Linha de "UsuarioModel" vinda do banco de dados.
 
-        - "from_attributes" (bool): Permite a criação de instâncias do schema a partir de objetos do SQLAlchemy.
+        :return: Instância do schema construída sem validação.
         """
-        from_attributes = True
+        obj = cls.model_construct(
+            id=usuario.id,
+            nome=usuario.nome,
+            sobrenome=usuario.sobrenome,
+            email=usuario.email,
+            admin=usuario.admin
+        )
+        obj.__pydantic_fields_set__ = {'id', 'nome', 'sobrenome', 'email', 'admin'}
+        return obj
 
 
 class UsuarioSchemaCreate(UsuarioSchemaBase):
@@ -43,43 +102,179 @@ class UsuarioSchemaCreate(UsuarioSchemaBase):
 
     Atributos:
 
-    - "senha" (str): Senha do usuário.
+    - "email" (EmailStr): Endereço de e-mail com validação RFC completa no cadastro.
+    - "senha" (SecretStr): Senha do usuário, mantida fora de logs e reprs.
     """
 
-    senha: str
+    email: EmailStr
+    senha: SecretStr
+
+
+T = TypeVar('T')
 
 
-class UsuarioSchemaArtigos(UsuarioSchemaBase):
+class UsuarioSchema(UsuarioSchemaBase, Generic[T]):
     """
-    Schema utilizado para representar um usuário junto com os artigos que ele criou.
+    Schema genérico de usuário parametrizado pelo tipo do campo de artigos.
 
-    Herda os campos do "UsuarioSchemaBase" e adiciona uma lista de artigos criados pelo usuário.
+    As variantes com artigos são parametrizações ("UsuarioSchema[...]") em vez
+    de subclasses escritas à mão: o Pydantic >= 2.11 cacheia e reaproveita o
+    core schema de modelos genéricos parametrizados, então cada variante nova
+    custa uma entrada de cache em vez de uma construção completa de schema.
 
     Atributos:
 
-    - "artigos" (List[ArtigoSchema], opcional): Lista de artigos criados pelo usuário.
+    - "artigos" (T): Carga de artigos conforme a parametrização (lista vazia se não houver).
     """
 
-    artigos: Optional[List[ArtigoSchema]] = None
+    # Campo obrigatório e sem union com None: o pydantic-core valida direto
+    # no validador do tipo parametrizado, em vez de testar os dois braços de
+    # um Optional não discriminado a cada resposta.
+    artigos: T
+
+    @classmethod
+    def from_orm_fast(cls, usuario) -> "UsuarioSchema":
+        """
+        Constrói o schema com artigos a partir de uma linha do banco sem revalidação.
+
+        Os artigos já carregados são convertidos com "model_construct" em uma
+        list comprehension, sem reparse campo a campo.
+
+        :param usuario: Linha de "UsuarioModel" com os artigos carregados.
+
+        :return: Instância do schema construída sem validação.
+        """
+        obj = cls.model_construct(
+            id=usuario.id,
+            nome=usuario.nome,
+            sobrenome=usuario.sobrenome,
+            email=usuario.email,
+            admin=usuario.admin,
+            artigos=[
+                ArtigoSchema.model_construct(
+                    id=artigo.id,
+                    titulo=artigo.titulo,
+                    descricao=artigo.descricao,
+                    url_fonte=artigo.url_fonte,
+                    usuario_id=artigo.usuario_id
+                )
+                for artigo in usuario.artigos
+            ]
+        )
+        obj.__pydantic_fields_set__ = {'id', 'nome', 'sobrenome', 'email', 'admin', 'artigos'}
+        return obj
 
 
-class UsuarioSchemaUp(UsuarioSchemaBase):
+UsuarioSchemaArtigos = UsuarioSchema[List["ArtigoSchema"]]
+"""
+Variante de usuário com a lista de artigos, obtida por parametrização do
+genérico. A referência a "ArtigoSchema" segue adiada: é resolvida por
+"rebuild_usuario_artigos_schema" no roteador que usa esta variante.
+"""
+
+
+def rebuild_usuario_artigos_schema() -> None:
     """
-    Schema utilizado para atualização parcial de um usuário.
+    Resolve a referência adiada a "ArtigoSchema" e constrói o core schema de
+    "UsuarioSchemaArtigos".
 
-    Herda os campos do "UsuarioSchemaBase", mas os campos são opcionais para facilitar atualizações parciais.
+    O import de "ArtigoSchema" é adiado (TYPE_CHECKING + anotação em string)
+    para que módulos que não retornam artigos não paguem a construção do
+    schema dele no startup. O roteador que usa "UsuarioSchemaArtigos" deve
+    chamar esta função uma única vez no import.
+    """
+    global ArtigoSchema
+    from .artigo_schema import ArtigoSchema
+    UsuarioSchemaArtigos.model_rebuild()
 
-    Atributos:
 
-    - "nome" (str, opcional): Nome do usuário (opcional para atualização).
-    - "sobrenome" (str, opcional): Sobrenome do usuário (opcional para atualização).
-    - "email" (str, opcional): Endereço de e-mail do usuário (opcional para atualização).
-    - "senha" (str, opcional): Senha do usuário (opcional para atualização).
-    - "admin" (bool, opcional): Privilégios administrativos (opcional para atualização).
+def _campo_opcional(campo) -> tuple:
     """
+    Converte um "FieldInfo" do schema base em uma definição de campo opcional.
+
+    O "campo.annotation" é só o tipo nu: o pattern de e-mail, o "strict" e o
+    "ge" dos ids vivem em "campo.metadata" e precisam ser reanexados via
+    "Annotated", senão o schema de atualização aceitaria valores que o base
+    rejeita.
+
+    :param campo: "FieldInfo" de um campo de "UsuarioSchemaBase".
+
+    :return: Tupla (anotação opcional com as mesmas restrições, default None).
+    """
+    anotacao = campo.annotation
+    if campo.metadata:
+        anotacao = Annotated[tuple([anotacao, *campo.metadata])]
+    return Optional[anotacao], None
+
+
+UsuarioSchemaUp = create_model(
+    "UsuarioSchemaUp",
+    __base__=UsuarioSchemaBase,
+    __doc__=(
+        "Schema utilizado para atualização parcial de um usuário.\n\n"
+        "Gerado via \"create_model\" a partir dos \"model_fields\" de\n"
+        "\"UsuarioSchemaBase\", tornando cada campo opcional sem redeclarar as\n"
+        "anotações à mão — o conjunto de campos e as restrições (pattern de\n"
+        "e-mail, ids estritos) ficam sempre em sincronia com o base.\n\n"
+        "Todos os campos do \"UsuarioSchemaBase\" mais \"senha\" (SecretStr) são\n"
+        "opcionais para atualização."
+    ),
+    **{
+        nome_campo: _campo_opcional(campo)
+        for nome_campo, campo in UsuarioSchemaBase.model_fields.items()
+    },
+    senha=(Optional[SecretStr], None)
+)
+
+
+_USER_FIELDS = tuple(sys.intern(nome) for nome in ('id', 'nome', 'sobrenome', 'email', 'admin'))
+"""
+Nomes dos campos de "UsuarioSchemaBase" internados com "sys.intern": as
+chaves do "__dict__" das instâncias construídas por "fast_from_row" comparam
+por identidade de ponteiro em vez de conteúdo.
+"""
+
+
+def fast_from_row(linha) -> UsuarioSchemaBase:
+    """
+    Monta um "UsuarioSchemaBase" direto de uma linha do banco.
+
+    Preenche o "__dict__" da instância sem passar pelo dispatch por campo do
+    Pydantic nem por um dict intermediário de entrada — o caminho de leitura
+    não aloca nada além do próprio objeto e do dict de atributos.
+
+    :param linha: Linha de "UsuarioModel" vinda do banco de dados.
+
+    :return: Instância de "UsuarioSchemaBase" construída sem validação.
+    """
+    obj = UsuarioSchemaBase.__new__(UsuarioSchemaBase)
+    obj.__dict__ = {nome: getattr(linha, nome) for nome in _USER_FIELDS}
+    obj.__pydantic_fields_set__ = set(_USER_FIELDS)
+    obj.__pydantic_extra__ = None
+    obj.__pydantic_private__ = None
+    return obj
+
+
+@lru_cache(maxsize=None)
+def get_cached_json_schema(cls) -> dict:
+    """
+    Retorna o JSON Schema de um schema de usuário, gerado uma única vez.
+
+    O "model_json_schema" percorre o core schema inteiro a cada chamada;
+    cachear o dict resultante faz consultas repetidas (documentação,
+    validadores externos) custarem um lookup. A geração fica adiada ao
+    primeiro uso para não anular o "defer_build" no startup.
+
+    :param cls: Classe de schema (por exemplo, "UsuarioSchemaBase").
+
+    :return: JSON Schema do schema informado.
+    """
+    return cls.model_json_schema()
+
 
-    nome: Optional[str] = None
-    sobrenome: Optional[str] = None
-    email: Optional[str] = None
-    senha: Optional[str] = None
-    admin: Optional[bool] = None
+UsuarioListAdapter = TypeAdapter(List[UsuarioSchemaBase])
+"""
+Adapter de lista de usuários construído uma única vez no import. Validar a
+lista inteira em uma chamada só amortiza a travessia Python<->Rust do
+pydantic-core, em vez de reentrar no validador uma vez por linha.
+"""
@@ -0,0 +1,105 @@
+"""
+Espelhos msgspec dos schemas de usuário, usados apenas na serialização de
+respostas de leitura.
+
+No caminho de leitura a única ação quente dos schemas é transformar linhas do
+banco em JSON; o "msgspec.Struct" faz isso sem as alocações por campo do
+pydantic-core. Os schemas Pydantic continuam nos caminhos de escrita
+(POST/PUT), onde a validação de entrada importa.
+
+Classes:
+
+- "ArtigoStruct": Espelho de "ArtigoSchema" para respostas.
+- "UsuarioStruct": Espelho de "UsuarioSchemaBase" para respostas.
+- "UsuarioArtigosStruct": Espelho de "UsuarioSchemaArtigos" para respostas.
+
+Funções:
+
+- "encode_usuario_artigos": Codifica um usuário com artigos em JSON, com memoização.
+"""
+
+from functools import lru_cache
+import msgspec
+
+
+class ArtigoStruct(msgspec.Struct, gc=False):
+    """
+    Espelho de "ArtigoSchema" para serialização de respostas.
+    """
+    id: int | None
+    titulo: str
+    descricao: str | None
+    url_fonte: str | None
+    usuario_id: int
+
+
+class UsuarioStruct(msgspec.Struct, gc=False):
+    """
+    Espelho de "UsuarioSchemaBase" para serialização de respostas.
+    """
+    id: int | None
+    nome: str | None
+    sobrenome: str | None
+    email: str
+    admin: bool
+
+
+class UsuarioArtigosStruct(UsuarioStruct, gc=False):
+    """
+    Espelho de "UsuarioSchemaArtigos" para serialização de respostas.
+    """
+    artigos: list[ArtigoStruct]
+
+
+@lru_cache(maxsize=2048)
+def _montar_resposta_usuario_artigos(id: int | None,
+                                     nome: str | None,
+                                     sobrenome: str | None,
+                                     email: str,
+                                     admin: bool,
+                                     artigos: tuple) -> bytes:
+    """
+    Monta e codifica a resposta de usuário com artigos, memoizada.
+
+    A chave do cache são os próprios dados da linha (a função é pura), então
+    qualquer escrita que altere o usuário ou seus artigos muda a chave e o
+    resultado antigo simplesmente deixa de ser consultado — não há
+    invalidação explícita a fazer.
+
+    :param artigos: Tuplas (id, titulo, descricao, url_fonte, usuario_id) dos artigos.
+
+    :return: Corpo JSON codificado da resposta.
+    """
+    corpo = UsuarioArtigosStruct(
+        id=id,
+        nome=nome,
+        sobrenome=sobrenome,
+        email=email,
+        admin=admin,
+        artigos=[ArtigoStruct(*artigo) for artigo in artigos]
+    )
+    return msgspec.json.encode(corpo)
+
+
+def encode_usuario_artigos(usuario) -> bytes:
+    """
+    Codifica um usuário com seus artigos em JSON.
+
+    GETs repetidos do mesmo usuário inalterado reduzem-se a uma montagem de
+    tupla e um lookup no LRU, sem reconstruir structs nem reserializar.
+
+    :param usuario: Linha de "UsuarioModel" com os artigos carregados.
+
+    :return: Corpo JSON codificado da resposta.
+    """
+    return _montar_resposta_usuario_artigos(
+        usuario.id,
+        usuario.nome,
+        usuario.sobrenome,
+        usuario.email,
+        usuario.admin,
+        tuple(
+            (artigo.id, artigo.titulo, artigo.descricao, artigo.url_fonte, artigo.usuario_id)
+            for artigo in usuario.artigos
+        )
+    )